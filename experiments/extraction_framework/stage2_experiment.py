@@ -1,5 +1,119 @@
-import pandas as pd
+"""
+Stage 2 extraction-framework experiment.
+
+Works against the ground-truth publication list in data/ground_truth/.
+"""
+import csv
+import functools
+from pathlib import Path
+
+GROUND_TRUTH_CSV = (
+    Path(__file__).resolve().parents[2] / "data" / "ground_truth" / "ground_truth.csv"
+)
+
+
+def load_csv(csv_path: Path = GROUND_TRUTH_CSV) -> list[dict]:
+    """
+    Load the ground-truth publication list.
+
+    Memoized on (resolved path, mtime): callers that need both the rows
+    and the total count don't re-read and re-parse the file, while an
+    edited CSV still busts the cache. Returns a fresh list each call so
+    callers can't mutate the cached rows.
+
+    Returns:
+        List of dicts with id/title/type/year/authors/doi/url keys.
+        Rows missing an ID or title are skipped.
+    """
+    csv_path = Path(csv_path)
+    return list(_load_csv_cached(str(csv_path.resolve()), csv_path.stat().st_mtime_ns))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_csv_cached(resolved_path: str, mtime_ns: int) -> tuple:
+    """
+    Parse the CSV with csv.reader and precomputed column indices, which
+    avoids DictReader's per-row dict allocation and per-column hash lookup.
+    """
+    csv_path = Path(resolved_path)
+    rows = []
+    with open(csv_path, newline="", encoding="utf-8") as fh:
+        reader = csv.reader(fh)
+        header = next(reader, None)
+        if header is None:
+            return tuple(rows)
+
+        idx = {name: i for i, name in enumerate(header)}
+        id_i = idx["Publication ID"]
+        title_i = idx["Publication Title"]
+        type_i = idx["Publication Type"]
+        year_i = idx["Publication Year"]
+        author_i = idx["Publication Author"]
+        doi_i = idx["Publication DOI"]
+        url_i = idx["Publication URL"]
+
+        for row in reader:
+            pub_id = row[id_i].strip()
+            title = row[title_i].strip()
+            if not pub_id or not title:
+                continue
+            rows.append({
+                "id": pub_id,
+                "title": title,
+                "type": row[type_i].strip(),
+                "year": row[year_i].strip(),
+                "authors": row[author_i].strip(),
+                "doi": row[doi_i].strip(),
+                "url": row[url_i].strip(),
+            })
+    return tuple(rows)
+
+
+def _normalized_doi(doi) -> str:
+    return (doi or "").strip().lower()
+
+
+def match_papers(rows: list[dict], papers: list[dict]) -> tuple[list, list, list]:
+    """
+    Join ground-truth rows to fetched Semantic Scholar papers by DOI.
+
+    Indexes the papers by normalized DOI once, then looks each CSV row
+    up in the index — a single-pass O(N + M) hash join instead of
+    comparing every row against every paper.
+
+    Args:
+        rows: Ground-truth rows from load_csv().
+        papers: Paper dicts from the API (e.g. fetch_papers_batch),
+            with externalIds/openAccessPdf fields.
+
+    Returns:
+        (found_with_pdf, found_no_pdf, not_found) — the first two are
+        rows augmented with a "paper" key holding the matched record.
+    """
+    by_doi = {}
+    for paper in papers:
+        if not paper:
+            continue
+        doi = _normalized_doi((paper.get("externalIds") or {}).get("DOI"))
+        if doi and doi not in by_doi:
+            by_doi[doi] = paper
+
+    found_with_pdf, found_no_pdf, not_found = [], [], []
+    for row in rows:
+        paper = by_doi.get(_normalized_doi(row.get("doi")))
+        if paper is None:
+            not_found.append(row)
+        elif (paper.get("openAccessPdf") or {}).get("url"):
+            found_with_pdf.append({**row, "paper": paper})
+        else:
+            found_no_pdf.append({**row, "paper": paper})
+    return found_with_pdf, found_no_pdf, not_found
 
 
 def main():
-    pass
+    rows = load_csv()
+    print(f"Loaded {len(rows)} ground-truth publications from {GROUND_TRUTH_CSV}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,18 +3,75 @@ Global configuration for IDRD Pipeline.
 Single source of truth for all settings.
 """
 from pathlib import Path
-from dotenv import load_dotenv
 import os
 
-# Load .env from project root
-env_path = Path(__file__).parent.parent / '.env'
-load_dotenv(dotenv_path=env_path)
-load_dotenv()
+__all__ = [
+    "SEMANTIC_SCHOLAR_API_URL", "SEMANTIC_SCHOLAR_API_KEY",
+    "S2_REQUEST_DELAY_SEC", "S2_MAX_RETRIES", "S2_HTTP_POOL", "S2_TIMEOUT_SEC",
+    "POSTGRES_HOST", "POSTGRES_PORT", "POSTGRES_DB",
+    "POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DSN", "POSTGRES_CONNINFO",
+    "LLM_BASE_URL", "LLM_API_KEY",
+    "PROJECT_ROOT", "BASE_DIR", "DATA_DIR",
+    "PDF_DIR", "XML_DIR", "MARKDOWN_DIR", "LOGS_DIR", "RUNS_DIR",
+    "CACHE_DIR", "S2_CACHE_PATH",
+    "DOWNLOAD_TIMEOUT_SEC", "DOWNLOAD_CHUNK_SIZE_BYTES",
+    "DOWNLOAD_DELAY_SEC", "DOWNLOAD_MAX_RETRIES", "DOWNLOAD_MAX_SIZE_BYTES",
+    "GROBID_STARTUP_TIMEOUT_SEC", "GROBID_ALIVE_CHECK_TIMEOUT_SEC",
+    "GROBID_CONVERSION_TIMEOUT_SEC", "GROBID_STARTUP_RETRY_TIMEOUT_SEC",
+    "CONVERSION_DELAY_SEC",
+    "RENDER_TIMEOUT_SEC",
+    "NUM_WORKERS",
+    "ensure_dirs",
+]
+
+
+def _load_env(path: Path) -> None:
+    """
+    Minimal .env loader: KEY=VALUE lines, # comments, optional quotes.
+
+    The project's .env is a handful of assignments, so a line split is
+    all that's needed — it keeps python-dotenv (and its full lexer pass)
+    off the cold-import path. Variables already present in the
+    environment win, matching load_dotenv's default behaviour.
+    """
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        key, sep, value = line.partition("=")
+        if not sep:
+            continue
+        os.environ.setdefault(key.strip(), value.strip().strip('"').strip("'"))
+
+
+# Resolve the project root once with string ops; Path.parent hops each
+# allocate and normalize an intermediate Path object.
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Load .env from project root (once — the second bare load_dotenv() call
+# re-parsed the same file from the CWD on every import for no gain)
+env_path = Path(_ROOT_DIR, '.env')
+if env_path.is_file():
+    # Spawn-mode worker processes inherit os.environ from the parent, so
+    # the mtime sentinel lets their re-import of config skip re-parsing
+    # an unchanged .env; an edited file still reloads.
+    _env_mtime = str(env_path.stat().st_mtime_ns)
+    if os.environ.get("_IDRD_ENV_LOADED") != _env_mtime:
+        _load_env(env_path)
+        os.environ["_IDRD_ENV_LOADED"] = _env_mtime
 
 # ── Semantic Scholar ───────────────────────────────────────────────────────────
 SEMANTIC_SCHOLAR_API_URL = "https://api.semanticscholar.org/graph/v1"
 SEMANTIC_SCHOLAR_API_KEY = os.getenv("SEMANTIC_SCHOLAR_API_KEY", "")
 
+# HTTP tuning for the fetch stage (consumed by pubfetcher.client).
+# Free tier allows 1 req/s, keyed access 10 req/s; the delay is the
+# pacing floor the adaptive limiter starts from.
+S2_REQUEST_DELAY_SEC = float(os.getenv("IDRD_S2_DELAY", "0.15"))
+S2_MAX_RETRIES = int(os.getenv("IDRD_S2_RETRIES", "5"))
+S2_HTTP_POOL = int(os.getenv("IDRD_S2_POOL", "32"))  # keep-alive connections
+S2_TIMEOUT_SEC = 30                                  # per-request timeout
+
 # ── PostgreSQL ─────────────────────────────────────────────────────────────────
 POSTGRES_HOST     = os.getenv("POSTGRES_HOST", "localhost")
 POSTGRES_PORT     = os.getenv("POSTGRES_PORT", "5432")
@@ -30,12 +87,23 @@ POSTGRES_DSN = (
     f"password={POSTGRES_PASSWORD}"
 )
 
+# Keyword form of the same settings, parsed once: passing
+# **POSTGRES_CONNINFO to psycopg2.connect skips libpq's DSN
+# tokenization on every new connection.
+POSTGRES_CONNINFO = {
+    "host": POSTGRES_HOST,
+    "port": int(POSTGRES_PORT),
+    "dbname": POSTGRES_DB,
+    "user": POSTGRES_USER,
+    "password": POSTGRES_PASSWORD,
+}
+
 # ── LLM (Phase 3) ──────────────────────────────────────────────────────────────
 LLM_BASE_URL = "https://api.groq.com/openai/v1"
 LLM_API_KEY    = os.getenv("LLM_API_KEY",    "")
 
 # ── Paths ──────────────────────────────────────────────────────────────────────
-PROJECT_ROOT = Path(__file__).parent.parent
+PROJECT_ROOT = Path(_ROOT_DIR)
 BASE_DIR = PROJECT_ROOT / "data"
 
 # Pipeline DATA — produced and consumed by pipeline steps
@@ -44,6 +112,10 @@ PDF_DIR      = DATA_DIR / "pdf"
 XML_DIR      = DATA_DIR / "xml"
 MARKDOWN_DIR = DATA_DIR / "markdown"
 
+# Disk-backed caches that survive across runs
+CACHE_DIR     = DATA_DIR / "cache"
+S2_CACHE_PATH = CACHE_DIR / "s2_responses.json"   # Semantic Scholar response cache
+
 # Pipeline LOGS — observational only, never read by the pipeline
 LOGS_DIR = PROJECT_ROOT / "logs"
 RUNS_DIR = LOGS_DIR / "runs"
@@ -55,6 +127,7 @@ DOWNLOAD_TIMEOUT_SEC = 60          # HTTP request timeout for downloading PDFs
 DOWNLOAD_CHUNK_SIZE_BYTES = 8192   # Chunk size for streaming downloads
 DOWNLOAD_DELAY_SEC = 0.5           # Delay between downloads to avoid rate limiting
 DOWNLOAD_MAX_RETRIES = 3           # Maximum retry attempts for failed downloads
+DOWNLOAD_MAX_SIZE_BYTES = 100 * 1024 * 1024  # Abort downloads larger than 100 MB
 
 # GROBID Converter  
 GROBID_STARTUP_TIMEOUT_SEC = 30    # Wait time for GROBID server to start
@@ -66,6 +139,34 @@ CONVERSION_DELAY_SEC = 0.1         # Delay between conversions
 # Renderer
 RENDER_TIMEOUT_SEC = 30            # Timeout for markdown rendering operations
 
-# Create directories on import
-for _dir in (PDF_DIR, XML_DIR, MARKDOWN_DIR, RUNS_DIR):
-    _dir.mkdir(parents=True, exist_ok=True)
\ No newline at end of file
+# Concurrency — single dial for the pipeline's worker pools.
+# Override with IDRD_WORKERS; capped at 8 so small machines aren't
+# oversubscribed and big ones don't hammer external services.
+NUM_WORKERS = int(os.getenv("IDRD_WORKERS") or min(os.cpu_count() or 1, 8))
+
+# Directory creation is lazy: pipeline entry points call ensure_dirs()
+# once, so merely importing config (tests, worker processes, --help) does
+# no filesystem work. The targets share ancestors (data/, logs/), so
+# instead of four mkdir(parents=True) calls that each stat every level up
+# the tree, the unique directories are collected once and created
+# shortest-path-first.
+_DIRS_CREATED = False
+
+
+def ensure_dirs() -> None:
+    """Create the pipeline data/log directories (idempotent, once per process)."""
+    global _DIRS_CREATED
+    if _DIRS_CREATED:
+        return
+    needed = set()
+    for target in (PDF_DIR, XML_DIR, MARKDOWN_DIR, CACHE_DIR, RUNS_DIR):
+        path = target
+        while path != PROJECT_ROOT and path != path.parent:
+            needed.add(path)
+            path = path.parent
+    for path in sorted(needed, key=lambda p: len(p.parts)):
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            pass
+    _DIRS_CREATED = True
\ No newline at end of file
@@ -1,4 +1,17 @@
-# It should ONLY export the class — never instantiate it
-from .db import IDRDDatabase
+# It should ONLY export the class — never instantiate it.
+# PEP 562 lazy import: the .db module (and psycopg2 behind it) loads only
+# when IDRDDatabase is first touched, so importing the package stays cheap
+# for callers that never open a database connection.
+__all__ = ["IDRDDatabase"]
 
-__all__ = ["IDRDDatabase"]
\ No newline at end of file
+
+def __getattr__(name):
+    if name == "IDRDDatabase":
+        from .db import IDRDDatabase
+        globals()["IDRDDatabase"] = IDRDDatabase
+        return IDRDDatabase
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(list(globals()) + __all__))
@@ -17,6 +17,8 @@ except ImportError:
     sys.path.append(str(Path(__file__).parent.parent.parent))
     from src import config
 
+from src.utils.db_utils import list_files_with_suffix
+
 # --- CONFIGURATION ---
 MARKDOWN_DIR = config.MARKDOWN_DIR
 logger = logging.getLogger(__name__)
@@ -250,13 +252,13 @@ if __name__ == "__main__":
     if args.file:
         run_extraction_pipeline(Path(args.file))
     elif args.all:
-        files = list(MARKDOWN_DIR.glob("*.md"))
+        files = list_files_with_suffix(MARKDOWN_DIR, ".md")
         logger.info("Found %s markdown files.", len(files))
         for f in files:
             run_extraction_pipeline(f)
     else:
         # Default behavior: run on the first file found (similar to original script)
-        files = list(MARKDOWN_DIR.glob("*.md"))
+        files = list_files_with_suffix(MARKDOWN_DIR, ".md")
         if files:
             logger.info("No arguments provided. Running on the first available file as a test.")
             run_extraction_pipeline(files[0])
@@ -2,8 +2,10 @@ import docker
 from docker.errors import NotFound, APIError, ImageNotFound
 import requests
 import time
+import threading
 import warnings
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from tqdm import tqdm
@@ -78,6 +80,15 @@ class GrobidConverter:
 
         self.container = None
         self.stats = {"successful": 0, "failed": 0, "skipped": 0}
+        # Guards stats when convert_papers runs with multiple workers
+        self._stats_lock = threading.Lock()
+
+        # Pooled keep-alive session: every conversion POSTs to the same
+        # local GROBID server, so reuse connections instead of paying a
+        # handshake per PDF. Sized to cover concurrent convert_papers runs.
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self.session.mount("http://", adapter)
 
         # DB is now optional - only needed for legacy methods
         self._owns_db = db is None  # Own DB if none was provided
@@ -160,6 +171,11 @@ class GrobidConverter:
     # Core conversion (returns ConversionResult)
     # ------------------------------------------------------------------
 
+    def _bump(self, key: str):
+        """Thread-safe stats increment (convert_papers may run workers)."""
+        with self._stats_lock:
+            self.stats[key] += 1
+
     def convert_pdf(
         self,
         pdf_path: Path,
@@ -174,7 +190,7 @@ class GrobidConverter:
             ConversionResult with success status, XML path, error info, etc.
         """
         if not pdf_path.exists():
-            self.stats["failed"] += 1
+            self._bump("failed")
             return ConversionResult(
                 paper_id=paper_id or pdf_path.stem,
                 success=False,
@@ -187,7 +203,7 @@ class GrobidConverter:
         output_path = self.output_dir / f"{paper_id}.tei.xml"
 
         if output_path.exists() and not overwrite:
-            self.stats["skipped"] += 1
+            self._bump("skipped")
             if delete_pdf:
                 try:
                     pdf_path.unlink()
@@ -203,18 +219,41 @@ class GrobidConverter:
                 xml_size_bytes=xml_size,
             )
 
+        # Stage the streamed body in a .part sibling so a connection drop
+        # mid-transfer never leaves a truncated .tei.xml that a later run
+        # would skip as "Already converted".
+        part_path = output_path.with_name(output_path.name + ".part")
+
         try:
+            # The open file handle streams the PDF through the multipart
+            # upload without materializing it in memory; stream=True does
+            # the same for the TEI XML coming back.
             with open(pdf_path, "rb") as f:
-                response = requests.post(
+                response = self.session.post(
                     f"{self.grobid_url}/api/processFulltextDocument",
-                    files={"input": f},
+                    files={"input": (pdf_path.name, f, "application/pdf")},
                     timeout=GROBID_CONVERSION_TIMEOUT_SEC,
+                    stream=True,
                 )
 
+                if response.status_code == 200:
+                    # Count bytes as they stream by; saves the stat() call
+                    # that would otherwise re-derive the size afterwards.
+                    xml_size = 0
+                    with open(part_path, "wb") as out:
+                        for chunk in response.iter_content(chunk_size=65536):
+                            if chunk:
+                                out.write(chunk)
+                                xml_size += len(chunk)
+                    part_path.replace(output_path)
+
+            if response.status_code != 200:
+                # Drop the unread streamed body so the pooled connection
+                # is released for the next conversion.
+                response.close()
+
             if response.status_code == 200:
-                output_path.write_text(response.text, encoding="utf-8")
-                self.stats["successful"] += 1
-                xml_size = output_path.stat().st_size
+                self._bump("successful")
 
                 if delete_pdf:
                     try:
@@ -233,7 +272,7 @@ class GrobidConverter:
                 )
 
             elif response.status_code == 503:
-                self.stats["failed"] += 1
+                self._bump("failed")
                 return ConversionResult(
                     paper_id=paper_id,
                     success=False,
@@ -242,7 +281,7 @@ class GrobidConverter:
                     error="GROBID service unavailable",
                 )
             else:
-                self.stats["failed"] += 1
+                self._bump("failed")
                 return ConversionResult(
                     paper_id=paper_id,
                     success=False,
@@ -252,7 +291,8 @@ class GrobidConverter:
                 )
 
         except requests.exceptions.Timeout:
-            self.stats["failed"] += 1
+            part_path.unlink(missing_ok=True)
+            self._bump("failed")
             return ConversionResult(
                 paper_id=paper_id,
                 success=False,
@@ -261,7 +301,8 @@ class GrobidConverter:
                 error="Request timeout",
             )
         except Exception as e:
-            self.stats["failed"] += 1
+            part_path.unlink(missing_ok=True)
+            self._bump("failed")
             return ConversionResult(
                 paper_id=paper_id,
                 success=False,
@@ -282,6 +323,7 @@ class GrobidConverter:
         overwrite: bool = False,
         delete_pdf: bool = False,
         delay: float = CONVERSION_DELAY_SEC,
+        max_workers: int = 1,
     ) -> List[ConversionResult]:
         """
         Convert PDFs to TEI XML from a list of paper dictionaries (database-agnostic).
@@ -295,7 +337,11 @@ class GrobidConverter:
             pdf_path_key: Key for PDF file path (default: 'pdf_path')
             overwrite: Whether to re-convert existing XMLs (default: False)
             delete_pdf: Whether to delete PDF after successful conversion (default: False)
-            delay: Seconds to wait between conversions (default: 0.1)
+            delay: Seconds to wait between conversions (sequential mode only)
+            max_workers: Concurrent conversion requests (default: 1 = sequential).
+                From Python's side each conversion is just an HTTP POST waiting
+                on the GROBID server, so threads are the right fit. The server's
+                org.grobid.max.connections must be >= max_workers.
 
         Returns:
             List of ConversionResult objects with success/failure info
@@ -314,7 +360,47 @@ class GrobidConverter:
         logger.info("Converting %s PDFs...", len(papers))
         results = []
 
+        if max_workers > 1:
+            # LPT scheduling: submit the biggest PDFs first so the slowest
+            # conversion doesn't land last on an otherwise-idle pool.
+            def _pdf_size(paper: Dict) -> int:
+                path = paper.get(pdf_path_key)
+                try:
+                    return Path(path).stat().st_size if path else 0
+                except OSError:
+                    return 0
+
+            papers = sorted(papers, key=_pdf_size, reverse=True)
+
         with tqdm(total=len(papers), desc="Converting PDFs", unit="file") as pbar:
+            if max_workers > 1:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = []
+                    for paper in papers:
+                        paper_id = paper.get(paper_id_key)
+                        pdf_path_str = paper.get(pdf_path_key)
+                        if not paper_id or not pdf_path_str:
+                            results.append(ConversionResult(
+                                paper_id=paper_id or "unknown",
+                                success=False,
+                                message="Missing paper ID or PDF path",
+                                error="Missing required fields",
+                            ))
+                            self._bump("failed")
+                            pbar.update(1)
+                            continue
+                        futures.append(executor.submit(
+                            self.convert_pdf,
+                            Path(pdf_path_str), paper_id, overwrite, delete_pdf,
+                        ))
+
+                    for future in as_completed(futures):
+                        result = future.result()
+                        results.append(result)
+                        pbar.set_postfix_str(result.message[:50])
+                        pbar.update(1)
+                return results
+
             for paper in papers:
                 paper_id = paper.get(paper_id_key)
                 pdf_path_str = paper.get(pdf_path_key)
@@ -327,7 +413,7 @@ class GrobidConverter:
                         error="Missing required fields",
                     )
                     results.append(result)
-                    self.stats["failed"] += 1
+                    self._bump("failed")
                     pbar.update(1)
                     continue
 
@@ -443,7 +529,8 @@ class GrobidConverter:
         logger.info("%s", "=" * 60)
 
     def close_db(self):
-        """Close database connection if we own it."""
+        """Close the HTTP session and database connection (if we own it)."""
+        self.session.close()
         if self._owns_db and self.db is not None:
             self.db.close()
 
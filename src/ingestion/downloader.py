@@ -1,9 +1,14 @@
 import requests
 import time
+import random
+import functools
+import threading
 import warnings
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 from tqdm import tqdm
 import re
 import sys
@@ -16,6 +21,7 @@ from config import (
     DOWNLOAD_TIMEOUT_SEC,
     DOWNLOAD_CHUNK_SIZE_BYTES,
     DOWNLOAD_DELAY_SEC,
+    DOWNLOAD_MAX_SIZE_BYTES,
 )
 from models.results import DownloadResult, PipelineStats
 from utils.db_utils import (
@@ -26,6 +32,66 @@ from utils.db_utils import (
 
 logger = logging.getLogger(__name__)
 
+# Characters Windows forbids in filenames; compiled once so filename
+# generation skips the re-cache lookup on every call.
+_FORBIDDEN_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+
+
+@functools.lru_cache(maxsize=4096)
+def _sanitized_filename(paper_id: str) -> str:
+    # Memoized: the same paper ID is sanitized repeatedly across the
+    # skip-existing check, retries and resume runs.
+    return f"{_FORBIDDEN_FILENAME_CHARS.sub('', paper_id)}.pdf"
+
+
+def _retry_sleep(attempt: int, retry_after: str = None):
+    """
+    Sleep before the next retry attempt.
+
+    Uses the server-provided Retry-After value when available, otherwise
+    capped exponential backoff. Jitter keeps concurrent workers from
+    retrying in lockstep.
+    """
+    wait = None
+    if retry_after:
+        try:
+            wait = float(retry_after)
+        except ValueError:
+            wait = None
+    if wait is None or wait < 0:
+        wait = min(30, 2 ** (attempt + 1))
+    time.sleep(wait * random.uniform(0.5, 1.0))
+
+
+class HostRateLimiter:
+    """
+    Per-host pacing between requests.
+
+    PDF URLs span many different publishers, so a single global delay
+    throttles fast hosts to the speed of the slowest. Each host gets its
+    own minimum interval between requests instead; pacing one host never
+    blocks downloads from another. Thread-safe for concurrent workers.
+    """
+
+    def __init__(self, min_interval: float = DOWNLOAD_DELAY_SEC):
+        self.min_interval = min_interval
+        self._last_request = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str):
+        """Block until this URL's host is allowed another request."""
+        if self.min_interval <= 0:
+            return
+        host = urlparse(url).netloc
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                remaining = self.min_interval - (now - self._last_request.get(host, 0.0))
+                if remaining <= 0:
+                    self._last_request[host] = now
+                    return
+            time.sleep(remaining)
+
 
 class PDFDownloader:
     """
@@ -57,7 +123,17 @@ class PDFDownloader:
                 'Chrome/91.0.4472.124 Safari/537.36'
             )
         }
+        # One pooled session per downloader: keep-alive reuses TCP+TLS
+        # connections across downloads instead of paying a fresh handshake
+        # per request.
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update(self.headers)
+        self.rate_limiter = HostRateLimiter()
         self.stats = {'successful': 0, 'failed': 0, 'skipped': 0, 'total_size': 0}
+        self._stats_lock = threading.Lock()
         logger.info("PDF Downloader initialized")
         logger.info("Output directory: %s", self.output_dir.absolute())
 
@@ -65,16 +141,56 @@ class PDFDownloader:
     # Helpers
     # ------------------------------------------------------------------
 
+    def _bump(self, key: str, amount: int = 1):
+        """Thread-safe stats update (download_papers may run workers)."""
+        with self._stats_lock:
+            self.stats[key] += amount
+
     def generate_filename(self, paper_id: str) -> str:
-        return f"{re.sub(r'[<>:\"/\\|?*]', '', paper_id)}.pdf"
+        return _sanitized_filename(paper_id)
 
     def is_valid_pdf(self, filepath: Path) -> bool:
+        # Only the 4-byte magic is read — never the whole file
         try:
             with open(filepath, 'rb') as f:
                 return f.read(4) == b'%PDF'
-        except Exception:
+        except OSError:
             return False
 
+    def _precheck_url(self, url: str) -> Optional[str]:
+        """
+        Probe a URL with HEAD and reject it on headers alone.
+
+        Mis-tagged HTML pages and oversized binaries can be rejected from
+        Content-Type/Content-Length without transferring the body. Returns
+        an error string to fail with, or None to proceed with the GET —
+        hosts that forbid HEAD (405/403) or error out fall through to the
+        normal GET path, which re-checks both conditions anyway.
+        """
+        try:
+            response = self.session.head(
+                url, allow_redirects=True, timeout=DOWNLOAD_TIMEOUT_SEC
+            )
+        except requests.exceptions.RequestException:
+            return None
+
+        if response.status_code != 200:
+            return None
+
+        content_type = response.headers.get('Content-Type', '').lower()
+        if content_type and 'pdf' not in content_type \
+                and 'application/octet-stream' not in content_type:
+            return f"Not a PDF (Content-Type: {content_type})"
+
+        try:
+            content_length = int(response.headers.get('Content-Length', 0))
+        except ValueError:
+            content_length = 0
+        if content_length > DOWNLOAD_MAX_SIZE_BYTES:
+            return f"Too large ({content_length / 1024 / 1024:.0f} MB)"
+
+        return None
+
     # ------------------------------------------------------------------
     # Core download (returns DownloadResult)
     # ------------------------------------------------------------------
@@ -93,7 +209,7 @@ class PDFDownloader:
             DownloadResult with success status, filepath, error info, etc.
         """
         if not url:
-            self.stats['skipped'] += 1
+            self._bump('skipped')
             return DownloadResult(
                 paper_id=paper_id,
                 success=False,
@@ -107,9 +223,9 @@ class PDFDownloader:
 
         if filepath.exists() and not overwrite:
             if self.is_valid_pdf(filepath):
-                self.stats['skipped'] += 1
+                self._bump('skipped')
                 file_size = filepath.stat().st_size
-                self.stats['total_size'] += file_size
+                self._bump('total_size', file_size)
                 return DownloadResult(
                     paper_id=paper_id,
                     success=True,
@@ -120,12 +236,32 @@ class PDFDownloader:
                 )
             filepath.unlink()
 
+        precheck_error = self._precheck_url(url)
+        if precheck_error:
+            self._bump('failed')
+            return DownloadResult(
+                paper_id=paper_id,
+                success=False,
+                message=f"{precheck_error}: {url}",
+                error=precheck_error,
+                url=url
+            )
+
+        # Download to a .part staging file so interrupted transfers can be
+        # resumed with an HTTP Range request instead of restarting at byte 0.
+        part_path = filepath.with_name(filename + '.part')
+
         for attempt in range(self.max_retries):
             try:
-                response = requests.get(url, headers=self.headers, timeout=DOWNLOAD_TIMEOUT_SEC, stream=True)
+                self.rate_limiter.wait(url)
+                offset = part_path.stat().st_size if part_path.exists() else 0
+                headers = {'Range': f'bytes={offset}-'} if offset > 0 else None
+                response = self.session.get(
+                    url, headers=headers, timeout=DOWNLOAD_TIMEOUT_SEC, stream=True
+                )
 
                 if response.status_code == 404:
-                    self.stats['failed'] += 1
+                    self._bump('failed')
                     return DownloadResult(
                         paper_id=paper_id,
                         success=False,
@@ -134,7 +270,7 @@ class PDFDownloader:
                         url=url
                     )
                 if response.status_code == 403:
-                    self.stats['failed'] += 1
+                    self._bump('failed')
                     return DownloadResult(
                         paper_id=paper_id,
                         success=False,
@@ -142,12 +278,37 @@ class PDFDownloader:
                         error="403 Forbidden",
                         url=url
                     )
+                if response.status_code == 416:
+                    # Stale/overlong partial — discard it and start over
+                    part_path.unlink(missing_ok=True)
+                    if attempt < self.max_retries - 1:
+                        continue
+                    self._bump('failed')
+                    return DownloadResult(
+                        paper_id=paper_id,
+                        success=False,
+                        message=f"416 Range Not Satisfiable: {url}",
+                        error="416 Range Not Satisfiable",
+                        url=url
+                    )
+                if response.status_code == 429:
+                    if attempt < self.max_retries - 1:
+                        _retry_sleep(attempt, response.headers.get('Retry-After'))
+                        continue
+                    self._bump('failed')
+                    return DownloadResult(
+                        paper_id=paper_id,
+                        success=False,
+                        message=f"429 Rate limited: {url}",
+                        error="429 Rate limited",
+                        url=url
+                    )
 
                 response.raise_for_status()
 
                 content_type = response.headers.get('Content-Type', '').lower()
                 if 'pdf' not in content_type and 'application/octet-stream' not in content_type:
-                    self.stats['failed'] += 1
+                    self._bump('failed')
                     return DownloadResult(
                         paper_id=paper_id,
                         success=False,
@@ -156,21 +317,54 @@ class PDFDownloader:
                         url=url
                     )
 
-                total_size = int(response.headers.get('content-length', 0))
-                with open(filepath, 'wb') as f:
-                    if total_size == 0:
-                        f.write(response.content)
-                    else:
-                        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE_BYTES):
-                            if chunk:
-                                f.write(chunk)
-
-                if not self.is_valid_pdf(filepath):
-                    filepath.unlink()
+                # Server honoured the Range request — append to the partial
+                # file; a 200 means it ignored it, so start from scratch.
+                resuming = response.status_code == 206 and offset > 0
+                if not resuming:
+                    offset = 0
+
+                total_size = offset + int(response.headers.get('content-length', 0))
+                if total_size > DOWNLOAD_MAX_SIZE_BYTES:
+                    part_path.unlink(missing_ok=True)
+                    self._bump('failed')
+                    return DownloadResult(
+                        paper_id=paper_id,
+                        success=False,
+                        message=f"Too large ({total_size / 1024 / 1024:.0f} MB): {url}",
+                        error="File exceeds size limit",
+                        url=url
+                    )
+
+                # Stream to disk so peak memory stays at one chunk per
+                # download, and abort if the body outgrows the size cap.
+                written = offset
+                # 1 MiB buffer batches the network chunks into fewer writes
+                with open(part_path, 'ab' if resuming else 'wb',
+                          buffering=1 << 20) as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE_BYTES):
+                        if chunk:
+                            f.write(chunk)
+                            written += len(chunk)
+                            if written > DOWNLOAD_MAX_SIZE_BYTES:
+                                break
+
+                if written > DOWNLOAD_MAX_SIZE_BYTES:
+                    part_path.unlink(missing_ok=True)
+                    self._bump('failed')
+                    return DownloadResult(
+                        paper_id=paper_id,
+                        success=False,
+                        message=f"Aborted: exceeded {DOWNLOAD_MAX_SIZE_BYTES / 1024 / 1024:.0f} MB limit",
+                        error="File exceeds size limit",
+                        url=url
+                    )
+
+                if not self.is_valid_pdf(part_path):
+                    part_path.unlink()
                     if attempt < self.max_retries - 1:
-                        time.sleep(2)
+                        _retry_sleep(attempt)
                         continue
-                    self.stats['failed'] += 1
+                    self._bump('failed')
                     return DownloadResult(
                         paper_id=paper_id,
                         success=False,
@@ -179,9 +373,11 @@ class PDFDownloader:
                         url=url
                     )
 
-                file_size = filepath.stat().st_size
-                self.stats['successful'] += 1
-                self.stats['total_size'] += file_size
+                part_path.replace(filepath)
+                # `written` already holds the final size; no need to stat
+                file_size = written
+                self._bump('successful')
+                self._bump('total_size', file_size)
                 return DownloadResult(
                     paper_id=paper_id,
                     success=True,
@@ -193,9 +389,9 @@ class PDFDownloader:
 
             except requests.exceptions.Timeout:
                 if attempt < self.max_retries - 1:
-                    time.sleep(2)
+                    _retry_sleep(attempt)
                     continue
-                self.stats['failed'] += 1
+                self._bump('failed')
                 return DownloadResult(
                     paper_id=paper_id,
                     success=False,
@@ -206,9 +402,9 @@ class PDFDownloader:
 
             except requests.exceptions.RequestException as e:
                 if attempt < self.max_retries - 1:
-                    time.sleep(2)
+                    _retry_sleep(attempt)
                     continue
-                self.stats['failed'] += 1
+                self._bump('failed')
                 return DownloadResult(
                     paper_id=paper_id,
                     success=False,
@@ -217,7 +413,7 @@ class PDFDownloader:
                     url=url
                 )
 
-        self.stats['failed'] += 1
+        self._bump('failed')
         return DownloadResult(
             paper_id=paper_id,
             success=False,
@@ -238,24 +434,30 @@ class PDFDownloader:
         title_key: str = 'title',
         delay: float = 0.5,
         overwrite: bool = False,
+        max_workers: int = 1,
     ) -> List[DownloadResult]:
         """
         Download PDFs from a list of paper dictionaries (database-agnostic).
-        
+
         This method works with any data source - DataFrame, JSON, API response, etc.
         Results can be persisted to database, DataFrame, or any storage backend.
-        
+
         Args:
             papers: List of dictionaries containing paper metadata
             paper_id_key: Key for paper ID in dictionary (default: 'paperId')
             url_key: Key path for PDF URL (default: 'url', supports nested like 'openAccessPdf.url')
             title_key: Key for paper title (default: 'title')
-            delay: Seconds to wait between downloads (default: 0.5)
+            delay: Minimum seconds between requests to the same host
+                (default: 0.5). Requests to different hosts are not
+                delayed against each other.
             overwrite: Whether to re-download existing PDFs (default: False)
-            
+            max_workers: Number of concurrent downloads (default: 1 = sequential).
+                Downloads are I/O-bound, so several PDFs in flight at once cut
+                wall-clock time roughly linearly with the worker count.
+
         Returns:
             List of DownloadResult objects with success/failure info
-            
+
         Example:
             >>> downloader = PDFDownloader()
             >>> papers = [{'paperId': '123', 'url': 'http://...', 'title': 'Paper 1'}]
@@ -263,21 +465,81 @@ class PDFDownloader:
             >>> successful = [r for r in results if r.success]
         """
         logger.info("Downloading %s papers...", len(papers))
+        self.rate_limiter.min_interval = delay
         results = []
 
+        def resolve_task(paper: Dict) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+            paper_id = paper.get(paper_id_key)
+            title = paper.get(title_key)
+
+            # Handle nested URL keys (e.g., 'openAccessPdf.url')
+            url = paper
+            for key in url_key.split('.'):
+                url = url.get(key, {}) if isinstance(url, dict) else None
+                if url is None:
+                    break
+            if isinstance(url, dict):
+                url = url.get('url')
+            return paper_id, url, title
+
+        def skip_existing(paper_id: str, url: str) -> Optional[DownloadResult]:
+            # Already-present PDFs are resolved here, before any HTTP work
+            # is scheduled, so re-runs over a mostly-populated output dir
+            # don't burn the per-host rate budget (or a worker slot) on
+            # no-ops.
+            if overwrite:
+                return None
+            filepath = self.output_dir / self.generate_filename(paper_id)
+            if not filepath.exists() or not self.is_valid_pdf(filepath):
+                return None
+            self._bump('skipped')
+            file_size = filepath.stat().st_size
+            self._bump('total_size', file_size)
+            return DownloadResult(
+                paper_id=paper_id,
+                success=True,
+                message=f"Already exists: {filepath.name}",
+                filepath=filepath,
+                file_size_bytes=file_size,
+                url=url
+            )
+
+        if max_workers > 1:
+            with tqdm(total=len(papers), desc="Downloading PDFs", unit="paper") as pbar:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = []
+                    for paper in papers:
+                        paper_id, url, title = resolve_task(paper)
+                        if not paper_id or not url:
+                            results.append(DownloadResult(
+                                paper_id=paper_id or 'unknown',
+                                success=False,
+                                message='Missing paper ID or URL',
+                                error='Missing required fields',
+                                url=url
+                            ))
+                            self._bump('skipped')
+                            pbar.update(1)
+                            continue
+                        existing = skip_existing(paper_id, url)
+                        if existing is not None:
+                            results.append(existing)
+                            pbar.update(1)
+                            continue
+                        futures.append(executor.submit(
+                            self.download_paper, paper_id, url, title, overwrite
+                        ))
+
+                    for future in as_completed(futures):
+                        result = future.result()
+                        results.append(result)
+                        pbar.set_postfix_str(result.message[:50])
+                        pbar.update(1)
+            return results
+
         with tqdm(total=len(papers), desc="Downloading PDFs", unit="paper") as pbar:
             for paper in papers:
-                paper_id = paper.get(paper_id_key)
-                title = paper.get(title_key)
-
-                # Handle nested URL keys (e.g., 'openAccessPdf.url')
-                url = paper
-                for key in url_key.split('.'):
-                    url = url.get(key, {}) if isinstance(url, dict) else None
-                    if url is None:
-                        break
-                if isinstance(url, dict):
-                    url = url.get('url')
+                paper_id, url, title = resolve_task(paper)
 
                 if not paper_id or not url:
                     result = DownloadResult(
@@ -288,7 +550,13 @@ class PDFDownloader:
                         url=url
                     )
                     results.append(result)
-                    self.stats['skipped'] += 1
+                    self._bump('skipped')
+                    pbar.update(1)
+                    continue
+
+                existing = skip_existing(paper_id, url)
+                if existing is not None:
+                    results.append(existing)
                     pbar.update(1)
                     continue
 
@@ -296,9 +564,6 @@ class PDFDownloader:
                 results.append(result)
                 pbar.set_postfix_str(result.message[:50])
                 pbar.update(1)
-                
-                if delay > 0:
-                    time.sleep(delay)
 
         return results
 
@@ -426,6 +691,7 @@ class PDFDownloader:
         logger.info("%s", "=" * 60)
 
     def close(self):
-        """Close database connection if we own it."""
+        """Close the HTTP session and database connection (if we own it)."""
+        self.session.close()
         if self._owns_db and self.db is not None:
             self.db.close()
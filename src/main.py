@@ -11,22 +11,28 @@ Pipeline Flow:
     7. Formality Evaluation - Determine formality score for the dataset reference
 """
 
+import os
 import sys
 import json
+import logging
+import logging.handlers
 import argparse
 import time
+
+try:  # optional: much faster JSON serialization for large result logs
+    import orjson
+except ImportError:
+    orjson = None
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
+from tqdm import tqdm
 
 sys.path.append(str(Path(__file__).parent))
 
-from pubfetcher.client import SemanticScholarClient
-from utils.dict_parser import PaperDictParser
-from db.db import IDRDDatabase
-from ingestion.downloader import PDFDownloader
-from ingestion.converter import GrobidConverter
-from ingestion.renderer import extract_markdown
+# Heavy pipeline dependencies (psycopg2, docker, pandas, lxml) are
+# imported inside the steps that need them so `--help` and argument
+# errors don't pay several hundred ms of import cost.
 from utils.db_utils import (
     print_download_status,
     print_conversion_status,
@@ -37,17 +43,33 @@ from utils.runtime_monitor import (
     RuntimeLiveSession,
     should_enable_live_monitor,
 )
-from config import PDF_DIR, XML_DIR, MARKDOWN_DIR, RUNS_DIR
+from config import (
+    PDF_DIR,
+    XML_DIR,
+    MARKDOWN_DIR,
+    RUNS_DIR,
+    S2_CACHE_PATH,
+    NUM_WORKERS,
+    ensure_dirs,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class IDRDPipeline:
     """Main pipeline orchestrator for IDRD paper processing."""
 
-    DEFAULT_DOWNLOAD_WORKERS = 8
-    DEFAULT_CONVERT_WORKERS = 4
-    DEFAULT_RENDER_WORKERS = 8
+    # Pool sizes derive from the shared NUM_WORKERS dial (IDRD_WORKERS
+    # env var); conversion stays smaller to match GROBID's default
+    # org.grobid.max.connections.
+    DEFAULT_DOWNLOAD_WORKERS = NUM_WORKERS
+    DEFAULT_CONVERT_WORKERS = min(4, NUM_WORKERS)
+    DEFAULT_RENDER_WORKERS = NUM_WORKERS
 
     def __init__(self):
+        from db.db import IDRDDatabase
+        from utils.dict_parser import PaperDictParser
+
         self.db = IDRDDatabase()
         self.parser = PaperDictParser()
         self.start_time = datetime.now()
@@ -128,13 +150,19 @@ class IDRDPipeline:
             runtime_state.task_started("fetch", query)
 
         try:
-            client = SemanticScholarClient()
-            papers = client.search_papers(
-                query=query,
-                limit=limit,
-                open_access_pdf=open_access_only,
-                fields_of_study=fields_of_study,
-            )
+            from pubfetcher.client import SemanticScholarClient
+
+            # The disk cache makes warm re-runs of the same query free
+            client = SemanticScholarClient(cache_path=S2_CACHE_PATH)
+            try:
+                papers = client.search_papers(
+                    query=query,
+                    limit=limit,
+                    open_access_pdf=open_access_only,
+                    fields_of_study=fields_of_study,
+                )
+            finally:
+                client.close()
         except Exception as e:
             if runtime_state:
                 runtime_state.task_finished("fetch", "failed", query, str(e))
@@ -197,6 +225,8 @@ class IDRDPipeline:
         print(f"  Output           : {PDF_DIR}")
         print("=" * 70)
 
+        from ingestion.downloader import PDFDownloader
+
         downloader = PDFDownloader(output_dir=str(PDF_DIR), db=None)  # No DB coupling
 
         try:
@@ -285,6 +315,8 @@ class IDRDPipeline:
         print(f"  Workers          : {self.DEFAULT_DOWNLOAD_WORKERS}")
         print("=" * 70)
 
+        from ingestion.downloader import PDFDownloader
+
         downloader = PDFDownloader(output_dir=str(PDF_DIR), db=None)
 
         try:
@@ -384,6 +416,8 @@ class IDRDPipeline:
         print("=" * 70)
 
         # Create converter (no DB coupling)
+        from ingestion.converter import GrobidConverter
+
         converter = GrobidConverter(output_dir=str(XML_DIR), db=None)
 
         try:
@@ -491,6 +525,8 @@ class IDRDPipeline:
         print(f"  Workers          : {self.DEFAULT_CONVERT_WORKERS}")
         print("=" * 70)
 
+        from ingestion.converter import GrobidConverter
+
         converter = GrobidConverter(output_dir=str(XML_DIR), db=None)
 
         try:
@@ -621,6 +657,10 @@ class IDRDPipeline:
         if runtime_state:
             runtime_state.queue_items("render", len(papers))
 
+        # Per-item progress goes through tqdm + logging rather than print:
+        # a print per rendered file takes the stdout lock and flushes each
+        # line, which distorts timing once rendering runs concurrently.
+        pbar = tqdm(total=len(papers), desc="Rendering markdown", unit="paper")
         for paper in papers:
             paper_id = paper["paperId"]
             xml_path = Path(paper["xml_path"])
@@ -628,26 +668,11 @@ class IDRDPipeline:
             if runtime_state:
                 runtime_state.task_started("render", paper_id)
 
-            if md_path.exists() and not overwrite:
-                stats["skipped"] += 1
-                results.append(
-                    {
-                        "paper_id": paper_id,
-                        "xml": xml_path.name,
-                        "md": md_path.name,
-                        "success": True,
-                        "message": f"Already exists: {md_path.name}",
-                    }
-                )
-                if runtime_state:
-                    runtime_state.task_finished(
-                        "render", "skipped", paper_id, f"Already exists: {md_path.name}"
-                    )
-                continue
-
             try:
-                # Use results-based renderer function
-                result = render_to_markdown(xml_path, md_path)
+                # Use results-based renderer function. No exists() pre-check
+                # here: render_to_markdown skips on its own via the mtime
+                # comparison, so a re-converted XML gets fresh markdown.
+                result = render_to_markdown(xml_path, md_path, overwrite=overwrite)
                 if result.success:
                     status = self._render_result_status(True, result.message)
                     if status == "successful":
@@ -659,10 +684,15 @@ class IDRDPipeline:
                             "render", status, paper_id, result.message
                         )
 
-                    size_kb = md_path.stat().st_size / 1024 if md_path.exists() else 0
-                    print(
-                        f"  [OK] {xml_path.name} -> {md_path.name} ({size_kb:.1f} KB)"
-                    )
+                    if status == "successful":
+                        size_kb = (
+                            md_path.stat().st_size / 1024 if md_path.exists() else 0
+                        )
+                        logger.info(
+                            "Rendered %s -> %s (%.1f KB)",
+                            xml_path.name, md_path.name, size_kb,
+                        )
+                    pbar.set_postfix_str(md_path.name[:50])
                     results.append(
                         {
                             "paper_id": paper_id,
@@ -687,7 +717,9 @@ class IDRDPipeline:
                 else:
                     stats["failed"] += 1
                     error_message = result.error or result.message
-                    print(f"  ✗ Failed to render {xml_path.name}: {error_message}")
+                    logger.warning(
+                        "Failed to render %s: %s", xml_path.name, error_message
+                    )
                     if runtime_state:
                         runtime_state.task_finished(
                             "render", "failed", paper_id, error_message
@@ -707,7 +739,7 @@ class IDRDPipeline:
                 error_msg = (
                     f"Failed to render {xml_path.name}: {type(e).__name__}: {str(e)}"
                 )
-                print(f"  ✗ {error_msg}")
+                logger.warning("%s", error_msg)
                 if runtime_state:
                     runtime_state.task_finished("render", "failed", paper_id, error_msg)
                 results.append(
@@ -719,6 +751,8 @@ class IDRDPipeline:
                         "message": error_msg,
                     }
                 )
+            pbar.update(1)
+        pbar.close()
 
         print("\n" + "-" * 70)
         print("STEP 4 COMPLETE")
@@ -1107,9 +1141,20 @@ class IDRDPipeline:
     # ------------------------------------------------------------------
 
     def _save_results(self, results: dict, filename: str):
+        # orjson serializes straight to bytes several times faster than
+        # json.dump and without building a multi-MB intermediate string;
+        # stdlib json is the fallback when it isn't installed. Written via
+        # tmp + os.replace so a kill mid-write never leaves a truncated log.
         out = self.run_dir / "metadata" / filename
-        with open(out, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2, ensure_ascii=False, default=str)
+        tmp = out.with_name(out.name + ".tmp")
+        if orjson is not None:
+            tmp.write_bytes(
+                orjson.dumps(results, option=orjson.OPT_INDENT_2, default=str)
+            )
+        else:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2, ensure_ascii=False, default=str)
+        os.replace(tmp, out)
         print(f"  Log saved to: {out}")
 
     def _print_final_summary(self):
@@ -1233,9 +1278,28 @@ MODES
     return parser
 
 
+def _configure_logging():
+    """
+    Route module logs to stderr through a memory-buffered handler.
+
+    Per-item progress lines (downloader, converter, renderer) are logged,
+    not printed; buffering them means hot loops don't pay a stream flush —
+    and its lock — per record once steps run concurrently. Warnings and
+    above flush immediately.
+    """
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter("%(message)s"))
+    buffered = logging.handlers.MemoryHandler(
+        capacity=256, flushLevel=logging.WARNING, target=stream
+    )
+    logging.basicConfig(level=logging.INFO, handlers=[buffered])
+
+
 def main():
     parser = build_parser()
     args = parser.parse_args()
+    _configure_logging()
+    ensure_dirs()
     pipeline = IDRDPipeline()
 
     try:
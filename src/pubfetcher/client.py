@@ -2,20 +2,134 @@ import os
 import sys
 import json
 import time
+import random
+import hashlib
 import logging
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from tqdm import tqdm
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from config import SEMANTIC_SCHOLAR_API_KEY, SEMANTIC_SCHOLAR_API_URL
+from config import (
+    SEMANTIC_SCHOLAR_API_KEY,
+    SEMANTIC_SCHOLAR_API_URL,
+    S2_REQUEST_DELAY_SEC,
+    S2_MAX_RETRIES,
+    S2_HTTP_POOL,
+    S2_TIMEOUT_SEC,
+)
 from utils.dict_parser import PaperDictParser
 
 logger = logging.getLogger(__name__)
 
 
+class AdaptiveDelay:
+    """AIMD pacing between Semantic Scholar requests.
+
+    A fixed inter-request delay is either too slow (wasted quota) or too
+    aggressive (429 storms). This controller additively shrinks the delay
+    while requests succeed and multiplicatively grows it when the API
+    throttles, so throughput converges on the real quota.
+    """
+
+    def __init__(
+        self,
+        base: float = 0.15,
+        minimum: float = 0.05,
+        maximum: float = 10.0,
+        decrease_step: float = 0.02,
+        backoff_factor: float = 2.0,
+    ):
+        self.delay = base
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease_step = decrease_step
+        self.backoff_factor = backoff_factor
+
+    def on_success(self):
+        """Additive decrease — probe for more headroom."""
+        self.delay = max(self.minimum, self.delay - self.decrease_step)
+
+    def on_throttle(self):
+        """Multiplicative increase — back off hard on 429/5xx."""
+        self.delay = min(self.maximum, self.delay * self.backoff_factor)
+
+    def wait(self):
+        time.sleep(self.delay)
+
+
+class ResponseCache:
+    """On-disk JSON cache for Semantic Scholar responses.
+
+    Re-running the same search hits the API for every batch even when
+    nothing changed. Caching responses keyed by the request parameters
+    makes repeat runs essentially free. Empty results are kept for a
+    shorter TTL so transient misses don't stick around for a week.
+    """
+
+    FLUSH_EVERY = 25
+
+    def __init__(self, path: Path, ttl_sec: int = 7 * 24 * 3600,
+                 empty_ttl_sec: int = 24 * 3600):
+        self.path = Path(path)
+        self.ttl_sec = ttl_sec
+        self.empty_ttl_sec = empty_ttl_sec
+        self._pending = 0
+        # Concurrent page fetches call get/set from worker threads.
+        self._lock = threading.Lock()
+        try:
+            self._entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            self._entries = {}
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        raw = "|".join(str(p) for p in parts)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if not entry:
+                return None
+            ttl = self.ttl_sec if entry.get("papers") else self.empty_ttl_sec
+            if time.time() - entry.get("ts", 0) > ttl:
+                del self._entries[key]
+                return None
+            return entry["papers"], entry["total"]
+
+    def set(self, key: str, papers: List[Dict], total: int):
+        with self._lock:
+            self._entries[key] = {"papers": papers, "total": total,
+                                  "ts": time.time()}
+            self._pending += 1
+            if self._pending >= self.FLUSH_EVERY:
+                self._flush_locked()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        """Write entries to disk; the caller must hold ``_lock``."""
+        if self._pending == 0:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self._entries), encoding="utf-8")
+            os.replace(tmp, self.path)
+            self._pending = 0
+        except OSError as e:
+            logger.warning("Could not write response cache %s: %s", self.path, e)
+
+
 class SemanticScholarClient:
     """Client for fetching publications from the Semantic Scholar API.
     ...
@@ -28,11 +142,46 @@ class SemanticScholarClient:
     """
 
     # Semantic Scholar free tier: 1 req/s  |  with key: 10 req/s
-    _REQUEST_DELAY = 0.15
-
-    def __init__(self, api_key: str = None):
+    _REQUEST_DELAY = S2_REQUEST_DELAY_SEC
+
+    # /paper/batch accepts at most 500 IDs per request
+    _BATCH_LIMIT = 500
+
+    DEFAULT_FIELDS = [
+        "paperId",
+        "title",
+        "abstract",
+        "year",
+        "authors",
+        "citationCount",
+        "referenceCount",
+        "influentialCitationCount",
+        "venue",
+        "publicationDate",
+        "publicationTypes",
+        "journal",
+        "fieldsOfStudy",
+        "url",
+        "externalIds",
+        "isOpenAccess",
+        "openAccessPdf",
+        "tldr",
+    ]
+
+    def __init__(self, api_key: str = None, cache_path: str = None,
+                 pool_size: int = S2_HTTP_POOL):
+        """
+        Args:
+            api_key:    Semantic Scholar API key (falls back to config/env).
+            cache_path: Optional path to an on-disk response cache; when
+                        set, identical requests are served from disk
+                        instead of re-hitting the API across runs.
+            pool_size:  Max keep-alive connections in the HTTP pool; raise
+                        it when driving many concurrent page/title fetches.
+        """
         self.api_key = api_key or SEMANTIC_SCHOLAR_API_KEY
         self.base_url = SEMANTIC_SCHOLAR_API_URL
+        self.cache = ResponseCache(Path(cache_path)) if cache_path else None
         self.headers = {}
 
         if self.api_key:
@@ -41,6 +190,32 @@ class SemanticScholarClient:
         else:
             logger.warning("No API key — using anonymous access (stricter rate limits)")
 
+        # Pooled keep-alive session: all batches hit the same host, so
+        # reusing one TCP+TLS connection avoids a handshake per request.
+        # HTTP/2 multiplexing would need httpx with the h2 extra, which is
+        # not a project dependency; HTTP/1.1 keep-alive covers the
+        # sequential fetch path with the same per-request cost.
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=16, pool_maxsize=pool_size
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(self.headers)
+        self._pacer = AdaptiveDelay(base=self._REQUEST_DELAY)
+
+        # Global request gate for the concurrent title-resolution path:
+        # worker threads reserve a send slot under the lock so the combined
+        # request rate stays within the pacer's current delay.
+        self._gate_lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def close(self):
+        """Flush the response cache and close the HTTP session."""
+        if self.cache:
+            self.cache.flush()
+        self.session.close()
+
     # ------------------------------------------------------------------
     # Public
     # ------------------------------------------------------------------
@@ -53,10 +228,16 @@ class SemanticScholarClient:
         fields: List[str] = None,
         fields_of_study: str = None,
         open_access_pdf: bool = False,
+        max_workers: int = 4,
     ) -> List[Dict]:
         """
         Search Semantic Scholar for papers matching a query.
 
+        The first page is fetched alone to learn the real result total;
+        the remaining pages are independent GETs bound by network latency,
+        so they are fetched concurrently through the global request gate
+        (more workers never means a higher request rate).
+
         Args:
             query:           Search string.
             limit:           Max number of papers to return.
@@ -64,6 +245,7 @@ class SemanticScholarClient:
             fields:          API fields to request (uses sensible defaults if None).
             fields_of_study: Filter e.g. "Computer Science".
             open_access_pdf: Only return papers that have a free PDF.
+            max_workers:     Concurrent page fetches (1 = sequential).
 
         Returns:
             List of paper/publication dicts.
@@ -78,26 +260,8 @@ class SemanticScholarClient:
         if open_access_pdf:
             logger.info("Filter: Open Access PDFs only")
 
-        default_fields = fields or [
-            "paperId",
-            "title",
-            "abstract",
-            "year",
-            "authors",
-            "citationCount",
-            "referenceCount",
-            "influentialCitationCount",
-            "venue",
-            "publicationDate",
-            "publicationTypes",
-            "journal",
-            "fieldsOfStudy",
-            "url",
-            "externalIds",
-            "isOpenAccess",
-            "openAccessPdf",
-            "tldr",
-        ]
+        # Joined once here; every page of this search shares the same list
+        fields_param = ",".join(fields or self.DEFAULT_FIELDS)
 
         all_papers = []
         batch_size = min(100, limit)  # API max is 100
@@ -105,59 +269,283 @@ class SemanticScholarClient:
         actual_total = None
 
         with tqdm(total=limit, desc="Fetching papers", unit="paper") as pbar:
-            for batch_idx in range(total_batches):
+            papers, total, error = self._fetch_batch(
+                query=query,
+                limit=batch_size,
+                offset=offset,
+                fields=fields_param,
+                fields_of_study=fields_of_study,
+                open_access_pdf=open_access_pdf,
+            )
+
+            if error:
+                pbar.write(f"  ⚠ Batch 1 failed: {error} — skipping.")
+            else:
+                pbar.write("API call successful!")
+                pbar.write(f"Total papers: {total:,}")
+                actual_total = total
+                if actual_total < limit:
+                    pbar.total = actual_total
+                    pbar.refresh()
+                all_papers.extend(papers)
+                pbar.update(len(papers))
+
+            pairs = []
+            for batch_idx in range(1, total_batches):
                 current_offset = offset + batch_idx * batch_size
                 current_limit = min(batch_size, limit - batch_idx * batch_size)
-
                 if actual_total is not None and current_offset >= actual_total:
                     pbar.write(
                         f"Reached actual total papers ({actual_total:,}) — stopping."
                     )
                     break
+                pairs.append((current_offset, current_limit))
 
-                papers, total, error = self._fetch_batch(
+            def fetch_page(pair):
+                page_offset, page_limit = pair
+                self._acquire_request_slot()
+                return self._fetch_batch(
                     query=query,
-                    limit=current_limit,
-                    offset=current_offset,
-                    fields=default_fields,
+                    limit=page_limit,
+                    offset=page_offset,
+                    fields=fields_param,
                     fields_of_study=fields_of_study,
                     open_access_pdf=open_access_pdf,
                 )
 
-                if error:
-                    pbar.write(f"  ⚠ Batch {batch_idx + 1} failed: {error} — skipping.")
-                    continue
+            if pairs:
+                workers = max(1, min(max_workers, len(pairs)))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    page_results = executor.map(fetch_page, pairs)
+                    for batch_idx, (papers, _, error) in enumerate(page_results, 2):
+                        if error:
+                            pbar.write(
+                                f"  ⚠ Batch {batch_idx} failed: {error} — skipping."
+                            )
+                            continue
+                        all_papers.extend(papers)
+                        pbar.update(len(papers))
 
-                if batch_idx == 0:
-                    pbar.write("API call successful!")
-                    pbar.write(f"Total papers: {total:,}")
-                    actual_total = total
-                    if actual_total < limit:
-                        pbar.total = actual_total
-                        pbar.refresh()
+        logger.info("Fetched %s papers.", len(all_papers))
+        return all_papers
 
-                if not papers:
+    def fetch_papers_batch(
+        self,
+        ids: List[str],
+        fields: List[str] = None,
+        max_retries: int = S2_MAX_RETRIES,
+    ) -> List[Optional[Dict]]:
+        """
+        Fetch metadata for many papers in bulk via POST /paper/batch.
+
+        One request covers up to 500 IDs, collapsing N per-paper lookups
+        into O(N/500) round trips. IDs may be Semantic Scholar paperIds or
+        prefixed external IDs such as "DOI:10.1...", "ARXIV:2106.15928".
+
+        Args:
+            ids:         Paper IDs to resolve.
+            fields:      API fields to request (DEFAULT_FIELDS if None).
+            max_retries: Retry attempts per chunk on 429/5xx.
+
+        Returns:
+            List of paper dicts aligned with `ids`; unresolved IDs are None.
+        """
+        if not ids:
+            return []
+
+        fields_param = ",".join(fields or self.DEFAULT_FIELDS)
+        papers: List[Optional[Dict]] = []
+
+        for start in range(0, len(ids), self._BATCH_LIMIT):
+            chunk = ids[start:start + self._BATCH_LIMIT]
+            if start > 0:
+                self._pacer.wait()
+
+            for attempt in range(max_retries):
+                try:
+                    response = self.session.post(
+                        f"{self.base_url}/paper/batch",
+                        params={"fields": fields_param},
+                        json={"ids": chunk},
+                        timeout=60,
+                    )
+
+                    if response.status_code == 429 or response.status_code >= 500:
+                        self._pacer.on_throttle()
+                        if attempt < max_retries - 1:
+                            wait = self._retry_wait(response, attempt, backoff=5)
+                            logger.warning(
+                                "Batch fetch throttled (%s) — waiting %.1fs (attempt %s/%s)...",
+                                response.status_code, wait, attempt + 1, max_retries,
+                            )
+                            time.sleep(wait)
+                            continue
+                        logger.warning("Batch fetch failed after %s attempts", max_retries)
+                        papers.extend([None] * len(chunk))
+                        break
+
+                    response.raise_for_status()
+                    self._pacer.on_success()
+                    papers.extend(response.json())
                     break
 
-                all_papers.extend(papers)
-                pbar.update(len(papers))
+                except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
+                    if attempt < max_retries - 1:
+                        time.sleep(min(60, 5 * (2**attempt)) * random.uniform(0.5, 1.0))
+                        continue
+                    logger.warning("Batch fetch error: %s", e)
+                    papers.extend([None] * len(chunk))
+                    break
 
-                if batch_idx < total_batches - 1:
-                    time.sleep(self._REQUEST_DELAY)
+        return papers
 
-        logger.info("Fetched %s papers.", len(all_papers))
-        return all_papers
+    def match_title(
+        self,
+        title: str,
+        fields: List[str] = None,
+        max_retries: int = S2_MAX_RETRIES,
+    ) -> Optional[Dict]:
+        """
+        Resolve a single title to its best-matching paper.
+
+        Uses GET /paper/search/match, which returns the API's top match for
+        an exact-ish title. A 404 means no confident match and is not an
+        error. Thread-safe: requests pass through the global rate gate.
+
+        Args:
+            title:       Publication title to resolve.
+            fields:      API fields to request (DEFAULT_FIELDS if None).
+            max_retries: Retry attempts on 429/5xx.
+
+        Returns:
+            The matching paper dict, or None if nothing matched.
+        """
+        params = {
+            "query": title,
+            "fields": ",".join(fields or self.DEFAULT_FIELDS),
+        }
+
+        for attempt in range(max_retries):
+            try:
+                self._acquire_request_slot()
+                response = self.session.get(
+                    f"{self.base_url}/paper/search/match",
+                    params=params,
+                    timeout=S2_TIMEOUT_SEC,
+                )
+
+                if response.status_code == 404:
+                    self._pacer.on_success()
+                    return None
+
+                if response.status_code == 429 or response.status_code >= 500:
+                    self._pacer.on_throttle()
+                    if attempt < max_retries - 1:
+                        time.sleep(self._retry_wait(response, attempt, backoff=5))
+                        continue
+                    logger.warning(
+                        "Title match failed after %s attempts: '%s'",
+                        max_retries, title,
+                    )
+                    return None
+
+                response.raise_for_status()
+                self._pacer.on_success()
+                data = response.json().get("data") or []
+                return data[0] if data else None
+
+            except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
+                if attempt < max_retries - 1:
+                    time.sleep(min(60, 5 * (2**attempt)) * random.uniform(0.5, 1.0))
+                    continue
+                logger.warning("Title match error for '%s': %s", title, e)
+                return None
+
+        return None
+
+    def resolve_titles(
+        self,
+        titles: List[str],
+        fields: List[str] = None,
+        max_workers: int = 8,
+    ) -> List[Optional[Dict]]:
+        """
+        Resolve many titles to papers concurrently.
+
+        Title lookups are independent and dominated by network latency, so
+        running them serially with a fixed sleep wastes most of the wall
+        time. Worker threads fan the lookups out while the shared request
+        gate keeps the combined rate within the global budget — adding
+        workers raises concurrency, not the request rate.
+
+        Args:
+            titles:      Publication titles to resolve.
+            fields:      API fields to request (DEFAULT_FIELDS if None).
+            max_workers: Concurrent lookup threads.
+
+        Returns:
+            List of paper dicts aligned with `titles`; unmatched are None.
+        """
+        if not titles:
+            return []
+
+        if max_workers <= 1 or len(titles) == 1:
+            return [self.match_title(t, fields=fields) for t in titles]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda t: self.match_title(t, fields=fields), titles))
 
     # ------------------------------------------------------------------
     # Private
     # ------------------------------------------------------------------
 
+    def _acquire_request_slot(self):
+        """
+        Block until this thread may send the next request.
+
+        Each caller reserves the next send slot under the lock and sleeps
+        outside it, so concurrent workers are serialized onto the pacer's
+        current inter-request delay instead of bursting together.
+        """
+        with self._gate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._pacer.delay
+        if slot > now:
+            time.sleep(slot - now)
+
+    @staticmethod
+    def _retry_wait(response, attempt: int, backoff: float) -> float:
+        """
+        Compute how long to wait before retrying a throttled request.
+
+        Honours the server's Retry-After header (seconds or HTTP-date) when
+        present; otherwise falls back to capped exponential backoff. The
+        result is jittered so concurrent fetchers don't retry in lockstep.
+        """
+        wait = None
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                wait = float(retry_after)
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                    wait = (retry_at - datetime.now(timezone.utc)).total_seconds()
+                except (TypeError, ValueError):
+                    wait = None
+
+        if wait is None or wait < 0:
+            wait = min(60, backoff * (2**attempt))
+
+        return wait * random.uniform(0.5, 1.0)
+
     def _fetch_batch(
         self,
         query: str,
         limit: int,
         offset: int,
-        fields: List[str],
+        fields: str,
         fields_of_study: str = None,
         open_access_pdf: bool = False,
         max_retries: int = 10,
@@ -171,11 +559,21 @@ class SemanticScholarClient:
         url = f"{self.base_url}/paper/search"
         params = {
             "query": query,
-            "fields": ",".join(fields),
+            "fields": fields,  # pre-joined comma-separated string
             "limit": limit,
             "offset": offset,
         }
 
+        cache_key = None
+        if self.cache:
+            cache_key = ResponseCache.make_key(
+                query, limit, offset, params["fields"], fields_of_study, open_access_pdf
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                papers, total = cached
+                return papers, total, None
+
         if fields_of_study:
             params["fieldsOfStudy"] = (
                 ",".join(fields_of_study)
@@ -193,16 +591,15 @@ class SemanticScholarClient:
 
         for attempt in range(max_retries):
             try:
-                response = requests.get(
-                    url, params=params, headers=self.headers, timeout=30
-                )
+                response = self.session.get(url, params=params, timeout=S2_TIMEOUT_SEC)
 
-                # Rate limited — exponential backoff
+                # Rate limited — honour Retry-After, else jittered backoff
                 if response.status_code == 429:
-                    wait = backoff * (2**attempt)
+                    self._pacer.on_throttle()
+                    wait = self._retry_wait(response, attempt, backoff)
                     if attempt < max_retries - 1:
                         logger.warning(
-                            "Rate limited — waiting %ss (attempt %s/%s)...",
+                            "Rate limited — waiting %.1fs (attempt %s/%s)...",
                             wait,
                             attempt + 1,
                             max_retries,
@@ -213,10 +610,11 @@ class SemanticScholarClient:
 
                 # Server error — transient, retry with backoff
                 if response.status_code >= 500:
-                    wait = backoff * (2**attempt)
+                    self._pacer.on_throttle()
+                    wait = self._retry_wait(response, attempt, backoff)
                     if attempt < max_retries - 1:
                         logger.warning(
-                            "Server error %s — waiting %ss (attempt %s/%s)...",
+                            "Server error %s — waiting %.1fs (attempt %s/%s)...",
                             response.status_code,
                             wait,
                             attempt + 1,
@@ -239,8 +637,12 @@ class SemanticScholarClient:
                     )
 
                 # Success
+                self._pacer.on_success()
                 data = response.json()
-                return data.get("data", []), data.get("total", 0), None
+                papers, total = data.get("data", []), data.get("total", 0)
+                if self.cache:
+                    self.cache.set(cache_key, papers, total)
+                return papers, total, None
 
             except requests.exceptions.Timeout:
                 wait = backoff * (2**attempt)
@@ -4,6 +4,7 @@ Centralises repeated query patterns used across downloader, converter, and main.
 
 Includes new persistence functions for results-based API.
 """
+import os
 import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, List
@@ -15,6 +16,25 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def list_files_with_suffix(directory: Path, suffix: str) -> List[Path]:
+    """
+    List a directory's files matching a suffix, sorted by name.
+
+    Cheaper than Path.glob on large directories: one readdir pass via
+    os.scandir, the suffix check runs on plain strings, and Path objects
+    are only built for matches.
+    """
+    if not directory.exists():
+        return []
+    names = [
+        entry.name
+        for entry in os.scandir(directory)
+        if entry.name.endswith(suffix) and entry.is_file()
+    ]
+    names.sort()
+    return [directory / name for name in names]
+
+
 def print_download_status(db: "IDRDDatabase", output_dir: Path):
     """Print current download status from the publications table."""
     db.cursor.execute("""
@@ -29,7 +49,7 @@ def print_download_status(db: "IDRDDatabase", output_dir: Path):
     """)
     row = db.cursor.fetchone()
 
-    pdf_files = list(output_dir.glob("*.pdf")) if output_dir.exists() else []
+    pdf_files = list_files_with_suffix(output_dir, ".pdf")
 
     logger.info(
         "Current Download Status:\n%s\n  Total papers in DB  : %s\n  PDFs downloaded     : %s\n  Download errors     : %s\n  PDF files on disk   : %s\n%s",
@@ -51,7 +71,7 @@ def print_conversion_status(db: "IDRDDatabase", xml_output_dir: Path):
         status['pdf_downloaded'],
         status['xml_converted'],
         status['xml_errors'],
-        len(list(xml_output_dir.glob('*.tei.xml'))),
+        len(list_files_with_suffix(xml_output_dir, ".tei.xml")),
         "-" * 60,
     )
 
@@ -63,7 +83,7 @@ def sync_existing_pdfs(db: "IDRDDatabase", pdf_output_dir: Path) -> int:
 
     Returns number of records synced.
     """
-    existing_pdfs = list(pdf_output_dir.glob("*.pdf"))
+    existing_pdfs = list_files_with_suffix(pdf_output_dir, ".pdf")
     if not existing_pdfs:
         return 0
 
@@ -5,6 +5,11 @@ import logging
 import pandas as pd
 import os
 
+try:  # optional: faster JSON serialization for large paper lists
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -192,10 +197,18 @@ class PaperDictParser:
             ensure_ascii: Whether to escape non-ASCII characters
         """
         output_path = self.output_dir / filename
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(self.parsed_papers, f, indent=indent, ensure_ascii=ensure_ascii)
-        
+
+        # orjson writes bytes directly and is several times faster than the
+        # pure-Python encoder on hundreds of nested paper dicts; it only
+        # supports 2-space indent and never escapes non-ASCII, so fall back
+        # to stdlib json when the caller needs other settings.
+        if orjson is not None and indent == 2 and not ensure_ascii:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(self.parsed_papers, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(self.parsed_papers, f, indent=indent, ensure_ascii=ensure_ascii)
+
         logger.info("Saved %s papers to %s", len(self.parsed_papers), output_path)
         return output_path
     
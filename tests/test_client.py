@@ -0,0 +1,214 @@
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from pubfetcher.client import AdaptiveDelay, ResponseCache, SemanticScholarClient
+
+
+def test_adaptive_delay_additive_decrease():
+    pacer = AdaptiveDelay(base=0.15, minimum=0.05, decrease_step=0.02)
+    pacer.on_success()
+    assert pacer.delay == 0.13
+    for _ in range(20):
+        pacer.on_success()
+    assert pacer.delay == 0.05  # floored at minimum
+
+
+def test_adaptive_delay_multiplicative_backoff():
+    pacer = AdaptiveDelay(base=0.15, maximum=1.0, backoff_factor=2.0)
+    pacer.on_throttle()
+    assert pacer.delay == 0.3
+    for _ in range(10):
+        pacer.on_throttle()
+    assert pacer.delay == 1.0  # capped at maximum
+
+
+def test_adaptive_delay_recovers_after_backoff():
+    pacer = AdaptiveDelay(base=0.1, minimum=0.05, decrease_step=0.05, backoff_factor=4.0)
+    pacer.on_throttle()
+    assert pacer.delay == 0.4
+    pacer.on_success()
+    pacer.on_success()
+    assert abs(pacer.delay - 0.3) < 1e-9
+
+
+def test_response_cache_roundtrip(tmp_path):
+    cache_file = tmp_path / "ss_cache.json"
+    cache = ResponseCache(cache_file)
+    key = ResponseCache.make_key("query", 100, 0, "title,year", None, True)
+
+    assert cache.get(key) is None
+    cache.set(key, [{"paperId": "p1"}], 1)
+    assert cache.get(key) == ([{"paperId": "p1"}], 1)
+
+    # survives a flush + reload cycle
+    cache.flush()
+    reloaded = ResponseCache(cache_file)
+    assert reloaded.get(key) == ([{"paperId": "p1"}], 1)
+
+
+def test_response_cache_expires_entries(tmp_path):
+    cache = ResponseCache(tmp_path / "ss_cache.json", ttl_sec=0, empty_ttl_sec=0)
+    key = ResponseCache.make_key("q", 1, 0, "title", None, False)
+    cache.set(key, [{"paperId": "p1"}], 1)
+    assert cache.get(key) is None  # expired immediately
+
+
+class FakePostResponse:
+    def __init__(self, status_code=200, payload=None, headers=None):
+        self.status_code = status_code
+        self._payload = payload or []
+        self.headers = headers or {}
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        pass
+
+
+class FakePostSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.posts = []
+
+    def post(self, url, params=None, json=None, timeout=None):
+        self.posts.append({"url": url, "params": params, "json": json})
+        return self.responses.pop(0)
+
+
+def test_fetch_papers_batch_single_chunk():
+    client = SemanticScholarClient(api_key="test-key")
+    payload = [{"paperId": "p1"}, None, {"paperId": "p3"}]
+    client.session = FakePostSession([FakePostResponse(payload=payload)])
+
+    papers = client.fetch_papers_batch(["DOI:10.1/a", "DOI:10.1/b", "DOI:10.1/c"])
+    assert papers == payload
+    post = client.session.posts[0]
+    assert post["url"].endswith("/paper/batch")
+    assert post["json"] == {"ids": ["DOI:10.1/a", "DOI:10.1/b", "DOI:10.1/c"]}
+
+
+def test_fetch_papers_batch_chunks_large_id_lists(monkeypatch):
+    client = SemanticScholarClient(api_key="test-key")
+    client._pacer.wait = lambda: None
+    ids = [f"id{i}" for i in range(750)]
+    client.session = FakePostSession([
+        FakePostResponse(payload=[{"paperId": i} for i in range(500)]),
+        FakePostResponse(payload=[{"paperId": i} for i in range(250)]),
+    ])
+
+    papers = client.fetch_papers_batch(ids)
+    assert len(papers) == 750
+    assert [len(p["json"]["ids"]) for p in client.session.posts] == [500, 250]
+
+
+def test_fetch_papers_batch_empty_ids():
+    client = SemanticScholarClient(api_key="test-key")
+    assert client.fetch_papers_batch([]) == []
+
+
+def test_response_cache_tolerates_corrupt_file(tmp_path):
+    cache_file = tmp_path / "ss_cache.json"
+    cache_file.write_text("{not json", encoding="utf-8")
+    cache = ResponseCache(cache_file)
+    key = ResponseCache.make_key("q", 1, 0, "title", None, False)
+    assert cache.get(key) is None
+    cache.set(key, [], 0)
+    assert cache.get(key) == ([], 0)
+
+class FakeGetResponse:
+    def __init__(self, status_code=200, payload=None, headers=None):
+        self.status_code = status_code
+        self._payload = payload or {}
+        self.headers = headers or {}
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeGetSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.gets = []
+
+    def get(self, url, params=None, timeout=None):
+        self.gets.append({"url": url, "params": params})
+        return self.responses.pop(0)
+
+
+def test_match_title_returns_top_match():
+    client = SemanticScholarClient(api_key="test-key")
+    client._pacer.delay = 0
+    client.session = FakeGetSession([
+        FakeGetResponse(payload={"data": [{"paperId": "p1", "title": "Attention"}]})
+    ])
+
+    paper = client.match_title("Attention Is All You Need")
+    assert paper["paperId"] == "p1"
+    assert client.session.gets[0]["url"].endswith("/paper/search/match")
+
+
+def test_match_title_no_match_is_none():
+    client = SemanticScholarClient(api_key="test-key")
+    client._pacer.delay = 0
+    client.session = FakeGetSession([FakeGetResponse(status_code=404)])
+    assert client.match_title("Nonexistent Title") is None
+
+
+def test_resolve_titles_preserves_order(monkeypatch):
+    client = SemanticScholarClient(api_key="test-key")
+    monkeypatch.setattr(
+        client, "match_title",
+        lambda title, fields=None: {"paperId": title.lower()},
+    )
+    papers = client.resolve_titles(["T1", "T2", "T3"], max_workers=4)
+    assert [p["paperId"] for p in papers] == ["t1", "t2", "t3"]
+
+
+def test_request_slot_serializes_concurrent_senders():
+    import time as _time
+    client = SemanticScholarClient(api_key="test-key")
+    client._pacer.delay = 0.02
+
+    start = _time.monotonic()
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        list(ex.map(lambda _: client._acquire_request_slot(), range(4)))
+    # 4 sends through a 0.02s gate take at least 3 intervals
+    assert _time.monotonic() - start >= 0.05
+
+
+def test_search_papers_paginates_all_batches():
+    client = SemanticScholarClient(api_key="test-key")
+    client._pacer.delay = 0
+    client.session = FakeGetSession([
+        FakeGetResponse(payload={"data": [{"paperId": f"a{i}"} for i in range(100)],
+                                 "total": 250}),
+        FakeGetResponse(payload={"data": [{"paperId": f"b{i}"} for i in range(100)],
+                                 "total": 250}),
+        FakeGetResponse(payload={"data": [{"paperId": f"c{i}"} for i in range(50)],
+                                 "total": 250}),
+    ])
+
+    papers = client.search_papers("query", limit=250, max_workers=1)
+    assert len(papers) == 250
+    assert [g["params"]["offset"] for g in client.session.gets] == [0, 100, 200]
+
+
+def test_search_papers_stops_at_actual_total():
+    client = SemanticScholarClient(api_key="test-key")
+    client._pacer.delay = 0
+    client.session = FakeGetSession([
+        FakeGetResponse(payload={"data": [{"paperId": f"a{i}"} for i in range(30)],
+                                 "total": 30}),
+    ])
+
+    papers = client.search_papers("query", limit=500, max_workers=1)
+    assert len(papers) == 30
+    assert len(client.session.gets) == 1  # no requests past the real total
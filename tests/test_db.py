@@ -11,7 +11,15 @@ from db import db as db_module
 from db.db import IDRDDatabase
 
 
+class FakeConnectionInfo:
+    encoding = "UTF8"
+
+
 class FakeCursor:
+    # Minimal surface for psycopg2.extras.execute_values, which reads the
+    # connection encoding and mogrifies each row before a single execute().
+    connection = FakeConnectionInfo()
+
     def __init__(self):
         self.executed = []
         self.fetchone_results = []
@@ -19,7 +27,16 @@ class FakeCursor:
         self.execute_side_effects = []
         self.rowcount = 0
 
+    def mogrify(self, template, args=None):
+        if isinstance(template, bytes):
+            template = template.decode()
+        if args is None:
+            return template.encode()
+        return str(tuple(args)).encode()
+
     def execute(self, query, params=None):
+        if isinstance(query, bytes):
+            query = query.decode()
         self.executed.append((str(query), params))
         if self.execute_side_effects:
             effect = self.execute_side_effects.pop(0)
@@ -38,6 +55,14 @@ class FakeCursor:
             return self.fetchall_results.pop(0)
         return []
 
+    def fetchmany(self, size=None):
+        if self.fetchall_results:
+            return self.fetchall_results.pop(0)
+        return []
+
+    def close(self):
+        pass
+
 
 class FakeConn:
     def __init__(self, cursor):
@@ -47,7 +72,7 @@ class FakeConn:
         self.rollback_calls = 0
         self.close_calls = 0
 
-    def cursor(self, cursor_factory=None):
+    def cursor(self, name=None, cursor_factory=None):
         return self._cursor
 
     def commit(self):
@@ -61,39 +86,49 @@ class FakeConn:
 
 
 @pytest.fixture
-def db_obj():
+def db_obj(monkeypatch):
+    monkeypatch.setattr(IDRDDatabase, "_instance", None)
     cursor = FakeCursor()
     conn = FakeConn(cursor)
     db = IDRDDatabase.__new__(IDRDDatabase)
     db.cursor = cursor
+    db._write_cursor = cursor
     db.conn = conn
     return db, cursor, conn
 
 
-def test_init_and_double_instantiation_warning(monkeypatch):
+def test_init_singleton_connects_once(monkeypatch):
     cursor = FakeCursor()
     conn = FakeConn(cursor)
-    monkeypatch.setattr(db_module.psycopg2, "connect", lambda **kwargs: conn)
-
-    calls = {"stack": 0}
-    import traceback
-
-    monkeypatch.setattr(traceback, "print_stack", lambda limit=8: calls.__setitem__("stack", calls["stack"] + 1))
-    IDRDDatabase._init_count = 0
+    connect_calls = []
+    monkeypatch.setattr(
+        db_module.psycopg2, "connect",
+        lambda **kwargs: connect_calls.append(kwargs) or conn,
+    )
+    monkeypatch.setattr(IDRDDatabase, "_instance", None)
 
     first = IDRDDatabase()
     second = IDRDDatabase()
 
+    assert second is first
+    assert len(connect_calls) == 1
     assert first.conn is conn
     assert second.cursor is cursor
     assert conn.autocommit is False
-    assert calls["stack"] == 1
-    assert conn.commit_calls >= 2
+    # schema commit + prepare commit: the second construction is a no-op
+    assert conn.commit_calls == 2
+
+    # close() drops the cached instance so the next construction reconnects
+    first.close()
+    assert conn.close_calls == 1
+    third = IDRDDatabase()
+    assert third is not first
+    assert len(connect_calls) == 2
 
 
 def test_insert_publication_success_paths(db_obj):
     db, cursor, _ = db_obj
-    cursor.fetchone_results = [{"id": 10}]
+    cursor.fetchall_results = [[(10,)]]
     paper = {
         "paperId": "p1",
         "title": "t",
@@ -145,7 +180,7 @@ def test_insert_publication_error_rolls_back(db_obj):
 
 def test_insert_publications_branches(db_obj):
     db, cursor, conn = db_obj
-    cursor.fetchone_results = [{"id": 1}, {"id": 2}, None]
+    cursor.fetchall_results = [[(1,), (2,)]]
     papers = [
         {},
         {"paperId": "p1", "authors": [{"authorId": "a1", "name": "A1"}, {"name": "Anon"}]},
@@ -153,7 +188,19 @@ def test_insert_publications_branches(db_obj):
     ]
     inserted = db.insert_publications(papers)
     assert inserted == 2
-    assert conn.commit_calls == 2
+    # one commit per batch, not per paper
+    assert conn.commit_calls == 1
+    assert any("SAVEPOINT paper_ingest" in q for q, _ in cursor.executed)
+    # authors go through a single unnest statement per paper
+    assert sum("unnest" in q for q, _ in cursor.executed) == 1
+
+
+def test_insert_publications_bulk_mode_rebuilds_indexes(db_obj):
+    db, cursor, conn = db_obj
+    inserted = db.insert_publications([{"paperId": "p1"}], bulk_mode=True)
+    assert inserted == 1
+    assert any("DROP INDEX IF EXISTS" in q for q, _ in cursor.executed)
+    assert sum("CREATE INDEX IF NOT EXISTS" in q for q, _ in cursor.executed) == 3
 
 
 def test_insert_publications_exception_path(db_obj):
@@ -190,15 +237,17 @@ def test_get_publication_none_and_full(db_obj):
         [{"type": "JournalArticle"}],
         [{"field": "CS"}],
         [{"id": 7, "citingPaperId": "cp", "citingPaperTitle": "CT", "citingPaperYear": 2018, "isInfluential": 1}],
-        [{"context": "ctx1"}],
-        [{"intent": "Background"}],
-        [{"authorId": "ca1", "name": "CA"}],
+        [{"citation_id": 7, "context": "ctx1"}],
+        [{"citation_id": 7, "intent": "Background"}],
+        [{"citation_id": 7, "authorId": "ca1", "name": "CA"}],
     ]
     result = db.get_publication("p1")
     assert result["paperId"] == "p1"
     assert result["publicationTypes"] == ["JournalArticle"]
     assert result["fieldsOfStudy"] == ["CS"]
     assert result["citations"][0]["isInfluential"] is True
+    assert result["citations"][0]["contexts"] == ["ctx1"]
+    assert result["citations"][0]["authors"] == [{"authorId": "ca1", "name": "CA"}]
 
 
 def test_search_publications_with_all_filters(db_obj):
@@ -217,7 +266,8 @@ def test_search_publications_with_all_filters(db_obj):
     assert rows == [{"paperId": "p1"}]
     query, params = cursor.executed[-1]
     assert "ILIKE" in query
-    assert params[-1] == 3
+    assert params["title"] == "%abc%"
+    assert params["limit"] == 3
 
 
 def test_search_publications_doi_false_open_access_true(db_obj):
@@ -232,18 +282,11 @@ def test_search_publications_doi_false_open_access_true(db_obj):
 def test_get_statistics_with_avg_and_zero(db_obj):
     db, cursor, _ = db_obj
     cursor.fetchone_results = [
-        {"count": 10},
-        {"min": 2000, "max": 2024},
-        {"avg": 2.5, "max": 9, "sum": 25},
-        {"count": 8},
-        {"count": 7},
-        {"count": 6},
-        {"count": 5},
-        {"count": 4},
-        {"count": 3},
-        {"count": 2},
-        {"count": 1},
-        {"count": 1},
+        {"total": 10, "year_min": 2000, "year_max": 2024,
+         "cite_avg": 2.5, "cite_max": 9, "cite_sum": 25, "with_abstract": 8},
+        {"with_doi": 7, "with_open_access": 6, "total_authors": 5},
+        {"total_citations": 4, "influential": 3, "papers_with_citation_data": 1,
+         "total_contexts": 2, "total_intents": 1},
     ]
     cursor.fetchall_results = [
         [{"venue": "v1", "count": 3}],
@@ -255,18 +298,11 @@ def test_get_statistics_with_avg_and_zero(db_obj):
     assert stats["top_fields"]["CS"] == 4
 
     cursor.fetchone_results = [
-        {"count": 0},
-        {"min": None, "max": None},
-        {"avg": None, "max": None, "sum": None},
-        {"count": 0},
-        {"count": 0},
-        {"count": 0},
-        {"count": 0},
-        {"count": 0},
-        {"count": 0},
-        {"count": 0},
-        {"count": 0},
-        {"count": 0},
+        {"total": 0, "year_min": None, "year_max": None,
+         "cite_avg": None, "cite_max": None, "cite_sum": None, "with_abstract": 0},
+        {"with_doi": 0, "with_open_access": 0, "total_authors": 0},
+        {"total_citations": 0, "influential": 0, "papers_with_citation_data": 0,
+         "total_contexts": 0, "total_intents": 0},
     ]
     cursor.fetchall_results = [[], []]
     stats = db.get_statistics()
@@ -313,7 +349,19 @@ def test_clear_and_drop_tables(db_obj):
     db.drop_tables()
     assert conn.commit_calls == 2
     assert calls["created"] == 1
-    assert len(cursor.executed) >= 24
+    assert any("TRUNCATE TABLE" in q for q, _ in cursor.executed)
+    assert sum("DROP TABLE" in q for q, _ in cursor.executed) == 1
+
+
+def test_truncate_all(db_obj):
+    db, cursor, conn = db_obj
+    cursor.fetchall_results = [[{"tablename": "publications"}, {"tablename": "bad-name"}]]
+    db.truncate_all()
+    assert conn.commit_calls == 1
+    assert any(
+        "TRUNCATE TABLE" in q and "RESTART IDENTITY CASCADE" in q
+        for q, _ in cursor.executed
+    )
 
 
 def test_reset_database_confirm_false(db_obj):
@@ -357,23 +405,34 @@ def test_reset_pipeline_status(db_obj):
     cursor.rowcount = 12
     db.reset_pipeline_status()
     assert conn.commit_calls == 1
-    assert any("UPDATE publications SET" in q for q, _ in cursor.executed)
+    assert any("EXECUTE reset_publication_status" in q for q, _ in cursor.executed)
 
 
 def test_export_to_json_limit_and_no_limit(db_obj, tmp_path):
     db, cursor, _ = db_obj
     output = tmp_path / "out.json"
-    cursor.fetchall_results = [[{"paperId": "p1"}]]
-    db.get_publication = lambda pid: {"paperId": pid, "title": "T"}
+    expected = {
+        "paperId": "p1", "title": "T",
+        "authors": [], "publicationTypes": [], "fieldsOfStudy": [], "citations": [],
+    }
+
+    # default is NDJSON: one publication per line
+    cursor.fetchall_results = [[{"paperId": "p1", "title": "T"}]]
     db.export_to_json(str(output), limit=1)
-    data = json.loads(output.read_text(encoding="utf-8"))
-    assert data == [{"paperId": "p1", "title": "T"}]
-    assert "LIMIT 1" in cursor.executed[-1][0]
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [expected]
+    assert any("LIMIT 1" in q for q, _ in cursor.executed)
+
+    # format='json' keeps the array shape
+    cursor.fetchall_results = [[{"paperId": "p1", "title": "T"}]]
+    db.export_to_json(str(output), format="json")
+    assert json.loads(output.read_text(encoding="utf-8")) == [expected]
 
-    output2 = tmp_path / "out2.json"
+    output2 = tmp_path / "out2.ndjson"
     cursor.fetchall_results = [[{"paperId": "p2"}]]
     db.export_to_json(str(output2))
-    assert json.loads(output2.read_text(encoding="utf-8"))[0]["paperId"] == "p2"
+    first_line = output2.read_text(encoding="utf-8").splitlines()[0]
+    assert json.loads(first_line)["paperId"] == "p2"
 
 
 def test_commit_close_and_context_manager(db_obj):
@@ -0,0 +1,21 @@
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from utils.db_utils import list_files_with_suffix
+
+
+def test_list_files_with_suffix_filters_and_sorts(tmp_path):
+    (tmp_path / "b.pdf").write_bytes(b"x")
+    (tmp_path / "a.pdf").write_bytes(b"x")
+    (tmp_path / "notes.txt").write_bytes(b"x")
+    (tmp_path / "nested").mkdir()
+
+    files = list_files_with_suffix(tmp_path, ".pdf")
+    assert [f.name for f in files] == ["a.pdf", "b.pdf"]
+
+
+def test_list_files_with_suffix_missing_dir(tmp_path):
+    assert list_files_with_suffix(tmp_path / "nope", ".pdf") == []
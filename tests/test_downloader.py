@@ -0,0 +1,235 @@
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+import time
+
+from ingestion.downloader import HostRateLimiter, PDFDownloader
+from models.results import DownloadResult
+
+
+def make_downloader(tmp_path):
+    return PDFDownloader(output_dir=str(tmp_path), db=None)
+
+
+def fake_download(paper_id, url, title=None, overwrite=False):
+    return DownloadResult(
+        paper_id=paper_id,
+        success=True,
+        message=f"Downloaded: {paper_id}.pdf",
+        url=url,
+    )
+
+
+def test_download_papers_sequential(tmp_path, monkeypatch):
+    downloader = make_downloader(tmp_path)
+    monkeypatch.setattr(downloader, "download_paper", fake_download)
+
+    papers = [
+        {"paperId": "p1", "url": "http://example.org/p1.pdf", "title": "T1"},
+        {"paperId": "p2", "url": "http://example.org/p2.pdf", "title": "T2"},
+    ]
+    results = downloader.download_papers(papers, delay=0)
+    assert [r.paper_id for r in results] == ["p1", "p2"]
+    assert all(r.success for r in results)
+
+
+def test_download_papers_concurrent(tmp_path, monkeypatch):
+    downloader = make_downloader(tmp_path)
+    monkeypatch.setattr(downloader, "download_paper", fake_download)
+
+    papers = [
+        {"paperId": f"p{i}", "url": f"http://example.org/p{i}.pdf"} for i in range(6)
+    ]
+    results = downloader.download_papers(papers, max_workers=4)
+    assert len(results) == 6
+    assert {r.paper_id for r in results} == {f"p{i}" for i in range(6)}
+
+
+def test_download_papers_missing_fields(tmp_path, monkeypatch):
+    downloader = make_downloader(tmp_path)
+    monkeypatch.setattr(downloader, "download_paper", fake_download)
+
+    papers = [
+        {"paperId": "p1"},                       # no URL
+        {"url": "http://example.org/p2.pdf"},    # no paper ID
+    ]
+    results = downloader.download_papers(papers, delay=0, max_workers=2)
+    assert all(not r.success for r in results)
+    assert downloader.stats["skipped"] == 2
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, headers=None, body=b""):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.body = body
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self.body), chunk_size):
+            yield self.body[i:i + chunk_size]
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self, responses, head_response=None):
+        self.responses = list(responses)
+        self.requests = []
+        # Default HEAD is 405 so tests exercise the GET fall-through path
+        self.head_response = head_response or FakeResponse(status_code=405)
+
+    def get(self, url, headers=None, timeout=None, stream=None):
+        self.requests.append({"url": url, "headers": headers or {}})
+        return self.responses.pop(0)
+
+    def head(self, url, allow_redirects=None, timeout=None):
+        self.requests.append({"url": url, "method": "HEAD"})
+        return self.head_response
+
+
+def test_download_paper_streams_to_disk(tmp_path):
+    downloader = make_downloader(tmp_path)
+    downloader.rate_limiter.min_interval = 0
+    body = b"%PDF-1.4 fake pdf body"
+    downloader.session = FakeSession([
+        FakeResponse(headers={"Content-Type": "application/pdf",
+                              "content-length": str(len(body))}, body=body)
+    ])
+
+    result = downloader.download_paper("p1", "http://example.org/p1.pdf")
+    assert result.success
+    assert (tmp_path / "p1.pdf").read_bytes() == body
+    assert not (tmp_path / "p1.pdf.part").exists()
+
+
+def test_download_paper_resumes_partial_with_range(tmp_path):
+    downloader = make_downloader(tmp_path)
+    downloader.rate_limiter.min_interval = 0
+    (tmp_path / "p1.pdf.part").write_bytes(b"%PDF-1.4 first half ")
+    tail = b"second half"
+    downloader.session = FakeSession([
+        FakeResponse(status_code=206,
+                     headers={"Content-Type": "application/pdf",
+                              "content-length": str(len(tail))},
+                     body=tail)
+    ])
+
+    result = downloader.download_paper("p1", "http://example.org/p1.pdf")
+    assert result.success
+    get_request = downloader.session.requests[-1]
+    assert get_request["headers"]["Range"] == "bytes=20-"
+    assert (tmp_path / "p1.pdf").read_bytes() == b"%PDF-1.4 first half second half"
+
+
+def test_download_paper_restarts_when_server_ignores_range(tmp_path):
+    downloader = make_downloader(tmp_path)
+    downloader.rate_limiter.min_interval = 0
+    (tmp_path / "p1.pdf.part").write_bytes(b"stale partial")
+    body = b"%PDF-1.4 complete body"
+    downloader.session = FakeSession([
+        FakeResponse(status_code=200,
+                     headers={"Content-Type": "application/pdf",
+                              "content-length": str(len(body))},
+                     body=body)
+    ])
+
+    result = downloader.download_paper("p1", "http://example.org/p1.pdf")
+    assert result.success
+    assert (tmp_path / "p1.pdf").read_bytes() == body
+
+
+def test_host_rate_limiter_paces_same_host_only():
+    limiter = HostRateLimiter(min_interval=0.05)
+
+    start = time.monotonic()
+    limiter.wait("http://slow.example.org/a.pdf")
+    limiter.wait("http://other.example.org/b.pdf")
+    cross_host = time.monotonic() - start
+    assert cross_host < 0.05  # different hosts don't wait on each other
+
+    start = time.monotonic()
+    limiter.wait("http://slow.example.org/c.pdf")
+    same_host = time.monotonic() - start
+    assert same_host >= 0.04  # same host is paced
+
+
+def test_host_rate_limiter_disabled_when_zero():
+    limiter = HostRateLimiter(min_interval=0)
+    start = time.monotonic()
+    for _ in range(100):
+        limiter.wait("http://example.org/x.pdf")
+    assert time.monotonic() - start < 0.05
+
+
+def test_download_papers_nested_url_key(tmp_path, monkeypatch):
+    downloader = make_downloader(tmp_path)
+    monkeypatch.setattr(downloader, "download_paper", fake_download)
+
+    papers = [{"paperId": "p1", "openAccessPdf": {"url": "http://example.org/p1.pdf"}}]
+    results = downloader.download_papers(papers, url_key="openAccessPdf.url", delay=0)
+    assert results[0].success
+    assert results[0].url == "http://example.org/p1.pdf"
+
+
+def test_download_papers_skips_existing_without_http(tmp_path, monkeypatch):
+    downloader = make_downloader(tmp_path)
+    (tmp_path / "p1.pdf").write_bytes(b"%PDF-1.4 already here")
+
+    def boom(*args, **kwargs):
+        raise AssertionError("download_paper should not run for existing PDFs")
+
+    monkeypatch.setattr(downloader, "download_paper", boom)
+    papers = [{"paperId": "p1", "url": "http://example.org/p1.pdf"}]
+    results = downloader.download_papers(papers, delay=0)
+    assert results[0].success
+    assert results[0].message.startswith("Already exists:")
+    assert downloader.stats["skipped"] == 1
+
+
+def test_precheck_rejects_html_by_head(tmp_path):
+    downloader = make_downloader(tmp_path)
+    downloader.rate_limiter.min_interval = 0
+    downloader.session = FakeSession(
+        [],  # no GET should happen
+        head_response=FakeResponse(headers={"Content-Type": "text/html"}),
+    )
+
+    result = downloader.download_paper("p1", "http://example.org/p1.pdf")
+    assert not result.success
+    assert "Not a PDF" in result.message
+    assert all(r.get("method") == "HEAD" for r in downloader.session.requests)
+
+
+def test_precheck_rejects_oversized_by_head(tmp_path):
+    downloader = make_downloader(tmp_path)
+    downloader.rate_limiter.min_interval = 0
+    downloader.session = FakeSession(
+        [],
+        head_response=FakeResponse(headers={
+            "Content-Type": "application/pdf",
+            "Content-Length": str(500 * 1024 * 1024),
+        }),
+    )
+
+    result = downloader.download_paper("p1", "http://example.org/p1.pdf")
+    assert not result.success
+    assert "Too large" in result.message
+
+
+def test_precheck_falls_through_when_head_forbidden(tmp_path):
+    downloader = make_downloader(tmp_path)
+    downloader.rate_limiter.min_interval = 0
+    body = b"%PDF-1.4 fake pdf body"
+    downloader.session = FakeSession(
+        [FakeResponse(headers={"Content-Type": "application/pdf",
+                               "content-length": str(len(body))}, body=body)],
+        head_response=FakeResponse(status_code=405),
+    )
+
+    result = downloader.download_paper("p1", "http://example.org/p1.pdf")
+    assert result.success
+    assert (tmp_path / "p1.pdf").read_bytes() == body